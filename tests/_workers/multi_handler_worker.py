@@ -0,0 +1,87 @@
+# ruff: noqa: INP001, PLC0415, G004
+
+"""Subprocess worker for test_multiple_handlers_during_shutdown.
+
+Configures two ConcurrentRotatingFileHandler instances and logs from several
+__del__ methods during real interpreter finalization. Invoked as:
+
+    python multi_handler_worker.py <log_file1> <log_file2>
+"""
+
+import logging.config
+import os
+import sys
+
+src_path = os.path.abspath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "src")
+)
+sys.path.insert(0, src_path)
+
+import concurrent_log_handler  # noqa: E402, F401
+
+
+class MultiDelLogger:
+    """Emits one record per name from a single finalizer during shutdown.
+
+    One batched __del__ instead of one object per name: each finalizer
+    wake-up during interpreter shutdown costs a GIL round-trip and a logging
+    lock acquisition, and a single finalizer still exercises both handlers.
+    """
+
+    def __init__(self, names):
+        self.names = names
+
+    # Pre-bind module globals as default arguments so the finalizer still
+    # works after globals are torn down at interpreter shutdown; the only
+    # shutdown sensitivity left is in the handler code under test.
+    def __del__(self, _getLogger=logging.getLogger, _stderr=sys.stderr, _print=print):
+        for name in self.names:
+            logger = _getLogger(f"shutdown_{name}")
+            try:
+                logger.error(f"Logging from {name} during shutdown")
+            except NameError as e:
+                _print(f"NAMEERROR_IN_{name}: {e}", file=_stderr)
+
+
+def main() -> None:
+    log_file1, log_file2 = sys.argv[1], sys.argv[2]
+
+    # Configure multiple handlers
+    logger_config = {
+        "version": 1,
+        "disable_existing_loggers": False,
+        "handlers": {
+            "file1": {
+                "()": "concurrent_log_handler.ConcurrentRotatingFileHandler",
+                "filename": log_file1,
+            },
+            "file2": {
+                "()": "concurrent_log_handler.ConcurrentRotatingFileHandler",
+                "filename": log_file2,
+            },
+        },
+        "loggers": {
+            "shutdown_obj1": {
+                "handlers": ["file1"],
+                "level": "DEBUG",
+            },
+            "shutdown_obj2": {
+                "handlers": ["file2"],
+                "level": "DEBUG",
+            },
+        },
+    }
+
+    logging.config.dictConfig(logger_config)
+
+    # Create one object that will log for every name during shutdown
+    keepers = MultiDelLogger([f"obj{i}" for i in range(5)])
+
+    # Keep it alive until shutdown
+    import __main__
+
+    __main__.keepers = keepers
+
+
+if __name__ == "__main__":
+    main()
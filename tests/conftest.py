@@ -0,0 +1,30 @@
+# ruff: noqa: INP001
+
+"""Shared pytest configuration for the test suite."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_PATH = str(Path(__file__).parent.parent / "src")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def prewarm_bytecode_cache() -> None:
+    """Populate __pycache__ for the modules the subprocess tests import.
+
+    The shutdown tests launch fresh interpreters; importing
+    concurrent_log_handler and logging.config once up front lets those
+    launches deserialize cached bytecode instead of recompiling from source.
+    """
+    env = {**os.environ, "PYTHONPATH": SRC_PATH}
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    subprocess.run(
+        [sys.executable, "-c", "import concurrent_log_handler, logging.config"],
+        env=env,
+        check=False,
+        capture_output=True,
+    )
@@ -1,6 +1,7 @@
 # ruff: noqa: INP001
 
 import logging
+import os
 import time
 from pathlib import Path
 
@@ -29,8 +30,10 @@ def test_timed_rollover_on_startup_after_downtime(tmp_path: Path, monkeypatch):
     rollover_interval_seconds = 2  # A short interval for the test
     initial_time = time.time()
 
-    # Monkeypatch time.time() to a fixed initial value
-    monkeypatch.setattr(time, "time", lambda: initial_time)
+    # Monkeypatch time.time() once, backed by a mutable clock we can advance
+    # later without re-patching.
+    clock = [initial_time]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
 
     # Create the first handler instance to establish an initial state
     # This will create the log file and the lock file with a rollover time
@@ -48,8 +51,7 @@ def test_timed_rollover_on_startup_after_downtime(tmp_path: Path, monkeypatch):
 
     # --- 2. Simulate a "Downtime" ---
     # We jump forward in time, past the scheduled rollover boundary, without sleeping.
-    time_after_downtime = initial_time + rollover_interval_seconds + 1
-    monkeypatch.setattr(time, "time", lambda: time_after_downtime)
+    clock[0] = initial_time + rollover_interval_seconds + 1
 
     # --- 3. Re-initialize the Handler (Simulate App Restart) ---
     # This is the critical step that will trigger the buggy or fixed logic in
@@ -64,15 +66,15 @@ def test_timed_rollover_on_startup_after_downtime(tmp_path: Path, monkeypatch):
     h2.close()  # Close the handler to ensure all startup logic has completed
 
     # --- 4. Assert the Outcome ---
-    # List all files in the temporary directory.
-    # We expect to find the main log, the lock file, AND a rotated log file.
-    files_in_dir = list(tmp_path.glob("*"))
-    rotated_log_files = [
-        f for f in files_in_dir if str(f.name).startswith(log_file.name + ".")
-    ]
-
-    print(f"Files found in test directory: {[f.name for f in files_in_dir]}")
+    # Alongside the main log and lock file we expect at least one rotated log
+    # file. A single scandir pass with early exit is enough to check that;
+    # only do the full (diagnostic) directory listing if we're about to fail.
+    found_rotated = any(
+        entry.name.startswith(log_file.name + ".") for entry in os.scandir(tmp_path)
+    )
+    if not found_rotated:
+        print(f"Files found in test directory: {[p.name for p in tmp_path.iterdir()]}")
 
     assert (
-        len(rotated_log_files) >= 1
+        found_rotated
     ), "A rotated log file should have been created on startup, but was not."